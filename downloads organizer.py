@@ -39,308 +39,319 @@ Required Libraries:
 Note: If send2trash is not available, empty folders will be deleted directly.
 """
 import os
+import re
+import json
+import errno
+import logging
 import zipfile
 import rarfile
 import shutil
 import tempfile
+import argparse
 import sys
+import contextlib
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 
 # Set terminal output to UTF-8
 sys.stdout.reconfigure(encoding='utf-8')
 
-# Get the directory where the script is located (instead of os.getcwd())
-script_directory = os.path.dirname(os.path.abspath(__file__))
+# Set ORGANIZER_DEBUG=1 to log archive inspection details
+DEBUG = os.environ.get("ORGANIZER_DEBUG") == "1"
+
+# Progress is logged at INFO level to stdout; archive inspection details are
+# logged at DEBUG level and hidden unless DEBUG is set
+log = logging.getLogger("organizer")
+log.setLevel(logging.DEBUG if DEBUG else logging.INFO)
+logging.basicConfig(level=logging.WARNING, stream=sys.stdout, format="%(message)s")
+
+# Get the path of this script and the directory where it is located (instead of os.getcwd())
+script_path = os.path.abspath(__file__)
+script_directory = os.path.dirname(script_path)
 
 # Check if py7zr is available for 7z support
 try:
     import py7zr
     SUPPORT_7Z = True
-    print("py7zr library found. 7z archives will be processed.")
+    log.info("py7zr library found. 7z archives will be processed.")
 except ImportError:
     SUPPORT_7Z = False
-    print("Note: Install 'py7zr' library to process 7z archives.")
-    print("To install: pip install py7zr")
+    log.info("Note: Install 'py7zr' library to process 7z archives.")
+    log.info("To install: pip install py7zr")
+
+# Check if send2trash is available for moving empty folders to the recycle bin
+try:
+    from send2trash import send2trash
+    log.info("send2trash library found. Empty folders will be moved to recycle bin.")
+except ImportError:
+    send2trash = None
+    log.info("Note: Install 'send2trash' library to move empty folders to recycle bin.")
+    log.info("To install: pip install send2trash")
+    log.info("Without this library, empty folders will be directly deleted.\n")
+
+# Number of archives inspected in parallel
+ARCHIVE_WORKERS = min(8, os.cpu_count() or 1)
+
+# Archives above these sizes (in bytes) are left unclassified instead of scanned.
+# Reading a listing is cheap, so that limit is higher than the one for checks
+# that may extract nested archives.
+MAX_SCAN_BYTES = int(os.environ.get("ORGANIZER_MAX_SCAN_BYTES", 512 * 1024 * 1024))
+MAX_LIST_BYTES = int(os.environ.get("ORGANIZER_MAX_LIST_BYTES", 4 * 1024 * 1024 * 1024))
+
+# Archive listings from earlier runs, so unchanged archives aren't read again
+LISTING_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".downloads_organizer_cache.json")
+# Bump when the record layout changes; a cache saved with another version (or
+# another set of archive extensions) is discarded
+LISTING_CACHE_VERSION = 2
+
+
+# File extensions (lowercase, so names can be matched with str.endswith)
+# Image file extensions
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.webp', '.svg', '.psd',
+                    '.ico', '.raw', '.cr2', '.nef', '.heic', '.heif', '.ai', '.eps', '.dds', '.tga', '.exr')
+
+# Document file extensions
+DOC_EXTENSIONS = ('.doc', '.docx', '.pdf', '.xls', '.xlsx', '.ppt', '.pptx', '.txt', '.rtf')
+
+# Ebook file extensions
+EBOOK_EXTENSIONS = ('.epub', '.mobi', '.azw', '.azw3', '.fb2', '.lrf', '.tcr', '.lit')
+
+# Substance file extensions
+SUBSTANCE_EXTENSIONS = ('.sbsar', '.sbs', '.sbsprs', '.sbsasm', '.sbsm', '.spsm')
+
+# Brush file extensions
+BRUSH_EXTENSIONS = ('.abr', '.tpl', '.brushset', '.brush', '.atn')
+
+# Font file extensions
+FONT_EXTENSIONS = ('.ttf', '.otf', '.woff', '.woff2', '.eot')
+
+# 3D model file extensions
+THREED_EXTENSIONS = ('.fbx', '.obj', '.3ds', '.dae', '.stl', '.ply', '.glb', '.gltf', '.abc', '.usd', '.usda', '.usdc', '.x3d')
+
+# Executable file extensions
+EXE_EXTENSIONS = ('.exe', '.msi', '.app', '.bat', '.cmd')
+
+# Davinci Resolve file extensions
+DAVINCI_EXTENSIONS = ('.setting',)
+
+# After Effects file extensions
+AEP_EXTENSIONS = ('.aep', '.aepx', '.aet', '.ffx', '.jsx', '.jsxbin')
+
+# Unity package extensions
+UNITY_EXTENSIONS = ('.unitypackage',)
+
+# ZBrush file extensions (including ZMT files)
+ZBRUSH_EXTENSIONS = ('.zmt', '.zsc', '.zpr', '.zbr', '.ztl', '.zb', '.zpz', '.zpk', '.zprj', '.zdl')
+
+# Unreal Engine asset extensions
+UE_EXTENSIONS = ('.uasset', '.uplugin', '.umap', '.uproject')
+
+# Mockup file extensions (PSD and TXT only)
+MOCKUP_EXTENSIONS = ('.psd', '.txt')
+
+# Keywords that send a file to the mockups directory regardless of its type
+# (add alternatives as "mockup|template" to match more keywords in one pass)
+MOCKUP_NAME_PATTERN = re.compile(r"mockup", re.IGNORECASE)
+
+# Audio file extensions
+AUDIO_EXTENSIONS = ('.mp3', '.wav', '.ogg', '.flac', '.aac', '.m4a', '.wma', '.aiff', '.mid', '.midi')
+
+# Blender add-on code (blend files are matched by BLEND_EXTENSION_PATTERN below)
+BLENDER_EXTENSIONS = ('.py',)
+
+# Blend files and all their numbered backups (.blend, .blend1, .blend2, etc.)
+BLEND_EXTENSION_PATTERN = re.compile(r"\.blend\d*")
+
+# Archive extensions
+ARCHIVE_EXTENSIONS = ('.zip', '.rar', '.7z') if SUPPORT_7Z else ('.zip', '.rar')
+
+# Extensions spanning two dots, which os.path.splitext would cut after the last one
+COMPOUND_EXTENSIONS = ('.tar.gz', '.tar.xz', '.tar.bz2')
+
+
+def file_extension(name_lower):
+    """Return the extension of a lowercase file name, keeping compound ones such as .tar.gz whole."""
+    if name_lower.endswith(COMPOUND_EXTENSIONS):
+        return '.' + '.'.join(name_lower.rsplit('.', 2)[1:])
+    return os.path.splitext(name_lower)[1]
+
+
+# Scratch directory for archive extraction, created once per run by main()
+scratch_directory = None
+
+
+@contextlib.contextmanager
+def scratch_subdirectory():
+    """Provide a temporary directory under the run's scratch directory and remove it afterwards."""
+    temp_dir = tempfile.mkdtemp(dir=scratch_directory)
+    try:
+        yield temp_dir
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
 
 
 def create_target_directory(directory):
     """Create the target directory if it doesn't exist."""
-    if not os.path.exists(directory):
+    try:
         os.makedirs(directory)
-        print(f"Directory created: {directory}")
+        log.info("Directory created: %s", directory)
+    except FileExistsError:
+        pass
 
 
 def debug_archive(archive_path):
-    """Thoroughly debug an archive by extracting and listing all files."""
+    """Thoroughly debug an archive by listing all files."""
     print(f"\n--- DEBUGGING ARCHIVE: {archive_path} ---")
     
-    with tempfile.TemporaryDirectory() as temp_dir:
-        # Extract archive based on type
-        try:
-            if archive_path.lower().endswith('.zip'):
-                with zipfile.ZipFile(archive_path, 'r') as zip_ref:
-                    zip_ref.extractall(temp_dir)
-            elif archive_path.lower().endswith('.rar'):
-                with rarfile.RarFile(archive_path, 'r') as rar_ref:
-                    rar_ref.extractall(temp_dir)
-            elif archive_path.lower().endswith('.7z') and SUPPORT_7Z:
-                with py7zr.SevenZipFile(archive_path, mode='r') as sz_ref:
-                    sz_ref.extractall(temp_dir)
-                    
-            # List all files recursively
-            print("Full listing of extracted contents:")
-            for root, dirs, files in os.walk(temp_dir):
-                rel_path = os.path.relpath(root, temp_dir)
-                if rel_path == '.':
-                    path_prefix = ""
-                else:
-                    path_prefix = rel_path + "/"
-                    
-                for file in files:
-                    print(f"  {path_prefix}{file}")
-                    
-            print("--- END DEBUG ---\n")
-        except Exception as e:
-            print(f"Error debugging archive: {e}")
-
-
-def contains_file_in_archive_zip(archive_path, file_extensions, archive_extensions):
-    """Check if a ZIP archive contains files with specific extensions, including in subdirectories."""
+    # The listing comes from the archive's index; nothing needs extracting
     try:
-        print(f"Examining zip archive: {archive_path}")
-        with zipfile.ZipFile(archive_path, 'r') as archive_file:
-            file_list = archive_file.namelist()
-            
-            # Log file list information
-            print(f"Archive contains {len(file_list)} files/directories")
-            for i, name in enumerate(file_list):
-                if i < 20:  # Print first 20 items for debugging
-                    print(f"  {name}")
-                elif i == 20:
-                    print(f"  ... and {len(file_list) - 20} more items")
-            
-            # Extract all contents to check subdirectories properly
-            with tempfile.TemporaryDirectory() as temp_dir:
-                archive_file.extractall(temp_dir)
+        entries = list_archive_entries(archive_path)
+        if entries is None:
+            print("Unsupported archive type")
+            return
+        
+        # List all files recursively
+        print("Full listing of archive contents:")
+        for name, is_dir in entries:
+            if not is_dir:
+                print(f"  {name}")
                 
-                # Walk through all extracted content
-                for root, dirs, files in os.walk(temp_dir):
-                    for file_name in files:
-                        lower_file_name = file_name.lower()
-                        
-                        # Check if file matches target extensions
-                        if any(ext.lower() in lower_file_name for ext in file_extensions):
-                            rel_path = os.path.relpath(os.path.join(root, file_name), temp_dir)
-                            print(f"Found match in subdirectory: {rel_path}")
-                            return True
-                            
-                        # Check for nested archives
-                        if any(lower_file_name.endswith(ext.lower()) for ext in archive_extensions):
-                            nested_path = os.path.join(root, file_name)
-                            try:
-                                if nested_path.lower().endswith('.zip'):
-                                    if contains_file_in_archive_zip(nested_path, file_extensions, archive_extensions):
-                                        return True
-                                elif nested_path.lower().endswith('.rar'):
-                                    if contains_file_in_archive_rar(nested_path, file_extensions, archive_extensions):
-                                        return True
-                                elif nested_path.lower().endswith('.7z') and SUPPORT_7Z:
-                                    if contains_file_in_archive_7z(nested_path, file_extensions, archive_extensions):
-                                        return True
-                            except Exception as nested_error:
-                                print(f"Error with nested archive {file_name}: {nested_error}")
+        print("--- END DEBUG ---\n")
     except Exception as e:
-        print(f"Error opening or processing zip archive: {archive_path} - {e}")
-    
-    print(f"No matching files found in {archive_path}")
-    return False
+        print(f"Error debugging archive: {e}")
 
 
-def contains_file_in_archive_rar(archive_path, file_extensions, archive_extensions):
-    """Check if a RAR archive contains files with specific extensions."""
-    try:
-        print(f"Examining RAR archive: {archive_path}")
-        with rarfile.RarFile(archive_path, 'r') as archive_file:
-            file_list = archive_file.namelist()
-            
-            # Log a sample of files
-            sample_size = min(5, len(file_list))
-            if sample_size > 0:
-                print(f"Sample of {sample_size} files from {len(file_list)} total:")
-                for i in range(sample_size):
-                    print(f"  {file_list[i]}")
-            
-            # Check all files in the archive
-            for file_name in file_list:
-                lower_file_name = file_name.lower()
-                if any(ext.lower() in lower_file_name for ext in file_extensions):
-
-                    print(f"Found match in RAR: {file_name}")
-                    return True
-                elif any(lower_file_name.endswith(ext.lower()) for ext in archive_extensions):
-                    with tempfile.TemporaryDirectory() as temp_dir:
-                        nested_path = os.path.join(temp_dir, file_name)
-                        try:
-                            archive_file.extract(file_name, temp_dir)
-                            if os.path.isfile(nested_path):
-                                if nested_path.lower().endswith('.zip'):
-                                    if contains_file_in_archive_zip(nested_path, file_extensions, archive_extensions):
-                                        return True
-                                elif nested_path.lower().endswith('.rar'):
-                                    if contains_file_in_archive_rar(nested_path, file_extensions, archive_extensions):
-                                        return True
-                                elif nested_path.lower().endswith('.7z') and SUPPORT_7Z:
-                                    if contains_file_in_archive_7z(nested_path, file_extensions, archive_extensions):
-                                        return True
-                        except Exception as nested_error:
-                            print(f"Error with nested archive {file_name}: {nested_error}")
-    except Exception as e:
-        print(f"Error opening RAR archive: {archive_path} - {e}")
-    return False
+def _info_entries(archive_file):
+    """List (name, is_dir) pairs for a zip or rar archive."""
+    return [(info.filename, info.is_dir()) for info in archive_file.infolist()]
 
-def contains_file_in_archive_7z(archive_path, file_extensions, archive_extensions):
-    """Check if a 7z archive contains files with specific extensions."""
-    if not SUPPORT_7Z:
-        return False
 
-    try:
-        print(f"Examining 7z archive: {archive_path}")
-        with py7zr.SevenZipFile(archive_path, mode='r') as archive_file:
-            # Get the list of files without extracting
-            file_list = archive_file.getnames()
-            
-            # Log all file names for debugging
-            print(f"Files in archive ({len(file_list)} total files):")
-            for i, name in enumerate(file_list):
-                if i < 10 or any(name.lower().endswith(ext.lower()) for ext in file_extensions):
-                    print(f"  {name}")
-                if i == 10 and len(file_list) > 10:
-                    print(f"  ... and {len(file_list) - 10} more files")
-            
-            # First, do a quick check of file names
-            for file_name in file_list:
-                lower_file_name = file_name.lower()
-                if any(ext.lower() in lower_file_name for ext in file_extensions):
+def _7z_entries(archive_file):
+    """List (name, is_dir) pairs for a 7z archive."""
+    return [(info.filename, info.is_directory) for info in archive_file.list()]
 
-                    print(f"Found match in 7z: {file_name} matches {file_extensions}")
-                    return True
-            
-            # Extract all files to a temporary directory for deeper inspection
-            print("No matches found in file names, extracting for deeper inspection...")
-            with tempfile.TemporaryDirectory() as temp_dir:
-                archive_file.extractall(path=temp_dir)
-                file_count = 0
-                matches_found = 0
-                
-                # Walk through the extracted directory and check files
-                for root, dirs, files in os.walk(temp_dir):
-                    file_count += len(files)
-                    for file_name in files:
-                        lower_file_name = file_name.lower()
-                        # Check for target file extensions
-                        if any(ext.lower() in lower_file_name for ext in file_extensions):
-
-                            matches_found += 1
-                            print(f"Found match in extracted content: {os.path.join(root, file_name)}")
-                            if matches_found >= 3:  # Limit log output
-                                print(f"Found {matches_found} matches, stopping search.")
-                                return True
-                            
-                        # Check for nested archives
-                        if any(lower_file_name.endswith(ext.lower()) for ext in archive_extensions):
-                            nested_path = os.path.join(root, file_name)
-                            try:
-                                if nested_path.lower().endswith('.zip'):
-                                    if contains_file_in_archive_zip(nested_path, file_extensions, archive_extensions):
-                                        return True
-                                elif nested_path.lower().endswith('.rar'):
-                                    if contains_file_in_archive_rar(nested_path, file_extensions, archive_extensions):
-                                        return True
-                                elif nested_path.lower().endswith('.7z'):
-                                    if contains_file_in_archive_7z(nested_path, file_extensions, archive_extensions):
-                                        return True
-                            except Exception as nested_error:
-                                print(f"Error with nested archive {file_name}: {nested_error}")
-                
-                print(f"Examined {file_count} extracted files, found {matches_found} matches.")
-                if matches_found > 0:
-                    return True
-                
-    except Exception as e:
-        print(f"Error opening 7z archive: {archive_path} - {e}")
-    
-    print(f"No matching files found in {archive_path}")
+
+def is_archive_too_large(archive_path, size, limit):
+    """Check if an archive exceeds a scan size limit, logging when it is skipped."""
+    if size > limit:
+        log.warning("Skipping contents of large archive (%s bytes): %s", size, archive_path)
+        return True
     return False
 
 
-def contains_file_in_archive(archive_path, file_extensions, archive_extensions):
+def _extract_members(archive_file, names, path):
+    """Extract the named members of a zip or rar archive and return the paths they were written to."""
+    return [archive_file.extract(name, path) for name in names]
+
+
+def _7z_extract_members(archive_file, names, path):
+    """Extract the named members of a 7z archive in a single pass and return their paths."""
+    archive_file.extract(path=path, targets=names)
+    return [os.path.join(path, name) for name in names]
+
+
+def is_within_directory(path, directory):
+    """Check if a path resolves to a location inside the given directory."""
+    directory = os.path.realpath(directory)
+    return os.path.commonpath([directory, os.path.realpath(path)]) == directory
+
+
+# Archive formats by extension: (opener, entry lister, member extractor)
+ARCHIVE_FORMATS = {
+    '.zip': (lambda path: zipfile.ZipFile(path, 'r'), _info_entries, _extract_members),
+    '.rar': (lambda path: rarfile.RarFile(path, 'r'), _info_entries, _extract_members),
+}
+if SUPPORT_7Z:
+    ARCHIVE_FORMATS['.7z'] = (lambda path: py7zr.SevenZipFile(path, mode='r'), _7z_entries, _7z_extract_members)
+
+
+def list_archive_entries(archive_path):
     """
-    Check if the archive (zip/rar/7z) or its nested archives contain any files matching the given extensions.
-    Delegates to format-specific functions.
-    
-    :param archive_path: Path to the archive file (zip/rar/7z)
-    :param file_extensions: File extensions to search for (e.g., .py, .uasset)
-    :param archive_extensions: Archive extensions to search for (e.g., .zip, .rar, .7z)
+    List (name, is_dir) pairs for every entry in a zip/rar/7z archive without extracting it.
+    Returns None for unsupported archive types.
     """
-    # Ensure file_extensions is a tuple
-    if isinstance(file_extensions, str):
-        file_extensions = (file_extensions,)
+    archive_format = ARCHIVE_FORMATS.get(file_extension(archive_path.lower()))
+    if archive_format is None:
+        return None
     
-    print(f"Checking archive {archive_path} for {file_extensions}")
-    
-    # Handle different archive types
-    if archive_path.lower().endswith('.zip'):
-        return contains_file_in_archive_zip(archive_path, file_extensions, archive_extensions)
-    elif archive_path.lower().endswith('.rar'):
-        return contains_file_in_archive_rar(archive_path, file_extensions, archive_extensions)
-    elif archive_path.lower().endswith('.7z') and SUPPORT_7Z:
-        return contains_file_in_archive_7z(archive_path, file_extensions, archive_extensions)
-    
-    return False
+    opener, lister, _ = archive_format
+    with opener(archive_path) as archive_file:
+        return lister(archive_file)
 
 
-def contains_only_specific_files_in_archive(archive_path, extensions_to_check):
-    """Check if an archive contains ONLY files with specific extensions."""
-    try:
-        print(f"Checking if archive contains only specific file types: {archive_path}")
+def list_archive_members(archive_path, errors=None):
+    """
+    List the lowercase base names of all files in an archive, including the files of nested archives.
+    Only the nested archives themselves are extracted, once, to be listed in turn. Nested archives
+    that can't be read are logged and skipped, and their names are added to errors if given.
+    """
+    archive_format = ARCHIVE_FORMATS.get(file_extension(archive_path.lower()))
+    if archive_format is None:
+        return []
+    
+    opener, lister, extractor = archive_format
+    with opener(archive_path) as archive_file:
+        file_list = [name for name, is_dir in lister(archive_file) if not is_dir]
+        members = [name.rsplit('/', 1)[-1].lower() for name in file_list]
         
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Extract archive based on its type
-            if archive_path.lower().endswith('.zip'):
-                with zipfile.ZipFile(archive_path, 'r') as zip_ref:
-                    zip_ref.extractall(temp_dir)
-            elif archive_path.lower().endswith('.rar'):
-                with rarfile.RarFile(archive_path, 'r') as rar_ref:
-                    rar_ref.extractall(temp_dir)
-            elif archive_path.lower().endswith('.7z') and SUPPORT_7Z:
-                with py7zr.SevenZipFile(archive_path, mode='r') as sz_ref:
-                    sz_ref.extractall(temp_dir)
-            else:
-                return False  # Unsupported archive type
-            
-            # Check if all files have the specified extensions
-            for root, dirs, files in os.walk(temp_dir):
-                for file in files:
-                    if not any(file.lower().endswith(ext.lower()) for ext in extensions_to_check):
-                        print(f"Found non-matching file: {file}")
-                        return False
-            
-            # If we got here, all files matched the specified extensions
-            return True
-            
-    except Exception as e:
-        print(f"Error checking file types in archive {archive_path}: {e}")
-        return False
+        nested_names = [name for name, member in zip(file_list, members) if member.endswith(ARCHIVE_EXTENSIONS)]
+        if nested_names:
+            with scratch_subdirectory() as temp_dir:
+                nested_paths = extractor(archive_file, nested_names, temp_dir)
+                for name, nested_path in zip(nested_names, nested_paths):
+                    # Member names like '../x.zip' or '/x.zip' must never lead outside the scratch directory
+                    if not is_within_directory(nested_path, temp_dir):
+                        log.warning("Skipping nested archive outside the extraction directory: %s", name)
+                        continue
+                    try:
+                        members.extend(list_archive_members(nested_path, errors))
+                    except Exception as nested_error:
+                        log.error("Error with nested archive %s: %s", name, nested_error)
+                        if errors is not None:
+                            errors.append(name)
+    
+    return members
+
+
+def only_specific_files(file_list, extensions_to_check):
+    """Check if every name in a lowercase archive file listing has one of the given extensions."""
+    for file_name in file_list:
+        if not file_name.endswith(extensions_to_check):
+            log.debug("Found non-matching file: %s", file_name)
+            return False
+    
+    # If we got here, all files matched the specified extensions
+    return True
 
 
 def move_file(source, target_directory):
     """Move the file to the target directory."""
     try:
         destination = os.path.join(target_directory, os.path.basename(source))
-        shutil.move(source, destination)
-        print(f"Moved: {source} -> {destination}")
+        # Target directories live next to the source, so a rename normally
+        # suffices; copying is only needed across filesystems. os.replace
+        # overwrites an existing file of the same name on every platform, as
+        # shutil.move did before.
+        try:
+            try:
+                os.replace(source, destination)
+            except FileNotFoundError:
+                # The target directory is only created when it is missing, which
+                # saves a makedirs call per file once it exists
+                if os.path.isdir(target_directory) or not os.path.exists(source):
+                    raise
+                create_target_directory(target_directory)
+                os.replace(source, destination)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            # shutil copies with sendfile on Linux and fcopyfile on macOS, and
+            # with a 1 MiB buffer on Windows, so its defaults are kept
+            shutil.move(source, destination)
+        log.info("Moved: %s -> %s", source, destination)
         return True
     except Exception as e:
-        print(f"Error moving file {source}: {e}")
+        log.error("Error moving file %s: %s", source, e)
         return False
 
 
@@ -349,144 +360,306 @@ def is_directory_empty(directory):
     Check if a directory is completely empty by recursively checking for files.
     A directory is considered empty if it contains no files in itself or its subdirectories.
     """
-    # Skip non-existent directories
-    if not os.path.exists(directory):
+    # An empty directory is answered by the first read of its listing
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                # Any file (or link) means the directory is not empty
+                if not entry.is_dir(follow_symlinks=False):
+                    return False
+                # Stop as soon as a subdirectory turns out to contain a file
+                if not is_directory_empty(entry.path):
+                    return False
+    except FileNotFoundError:
+        # Skip non-existent directories
         return True
-    
-    # Check all files and subdirectories
-    for root, dirs, files in os.walk(directory):
-        # If there are any files, the directory is not empty
-        if files:
-            return False
+    except PermissionError:
+        # A directory that can't be listed is never treated as empty
+        return False
     
     # If we got here, no files were found
     return True
 
 
-def safe_delete_directory(directory, send2trash_available):
+def safe_delete_directory(directory):
     """Safely delete or move a directory to the recycle bin."""
     try:
-        if send2trash_available:
-            import send2trash
-            send2trash.send2trash(directory)
-            print(f"Directory moved to recycle bin: {directory}")
+        if send2trash is not None:
+            send2trash(directory)
+            log.info("Directory moved to recycle bin: %s", directory)
         else:
             shutil.rmtree(directory)
-            print(f"Directory deleted: {directory}")
+            log.info("Directory deleted: %s", directory)
         return True
     except Exception as e:
-        print(f"Error removing directory {directory}: {e}")
+        log.error("Error removing directory %s: %s", directory, e)
         return False
     
 
-def handle_mockup_files(file_name, file_path, mockups_directory, directories_used):
+def has_entries(directory):
+    """Check if a directory exists and holds anything; missing or unreadable directories count as empty."""
+    try:
+        with os.scandir(directory) as entries:
+            return next(entries, None) is not None
+    except OSError:
+        return False
+
+
+def handle_mockup_files(file_name, file_path, mockups_directory):
     """Check if 'mockup' is in the file name and move it to mockups directory if true."""
-    if "mockup" in file_name.lower():
-        create_target_directory(mockups_directory)
+    if MOCKUP_NAME_PATTERN.search(file_name):
         if move_file(file_path, mockups_directory):
-            directories_used.add(mockups_directory)
-            print(f"File/archive with 'mockup' in name moved to mockups directory: {file_path}")
-            return True  # Indicates the file was handled
-    return False  # Indicates the file was not handled
-
-def handle_audio_files(file_name, file_path, sfx_directory, directories_used):
-    """Check if the file is an audio file and move it to sfx directory if true."""
-    audio_extensions = ('.mp3', '.wav', '.ogg', '.flac', '.aac', '.m4a', '.wma', '.aiff', '.mid', '.midi')
-    if file_name.lower().endswith(audio_extensions):
-        create_target_directory(sfx_directory)
-        if move_file(file_path, sfx_directory):
-            directories_used.add(sfx_directory)
-            print(f"Audio file moved to sfx directory: {file_path}")
+            log.info("File/archive with 'mockup' in name moved to mockups directory: %s", file_path)
             return True  # Indicates the file was handled
     return False  # Indicates the file was not handled
 
 
-def check_audio_archive(archive_path, archive_extensions):
-    """Check if an archive contains only audio files or audio files plus .txt files."""
-    audio_extensions = ('.mp3', '.wav', '.ogg', '.flac', '.aac', '.m4a', '.wma', '.aiff', '.mid', '.midi')
-    allowed_extensions = audio_extensions + ('.txt',)  # Only audio and .txt allowed
+def only_audio_files(file_list):
+    """Check if a lowercase archive file listing holds audio files, optionally alongside .txt files, and nothing else."""
+    allowed_extensions = AUDIO_EXTENSIONS + ('.txt',)  # Only audio and .txt allowed
     
-    try:
-        print(f"Checking archive for audio content: {archive_path}")
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Extract archive based on its type
-            if archive_path.lower().endswith('.zip'):
-                with zipfile.ZipFile(archive_path, 'r') as zip_ref:
-                    zip_ref.extractall(temp_dir)
-            elif archive_path.lower().endswith('.rar'):
-                with rarfile.RarFile(archive_path, 'r') as rar_ref:
-                    rar_ref.extractall(temp_dir)
-            elif archive_path.lower().endswith('.7z') and SUPPORT_7Z:
-                with py7zr.SevenZipFile(archive_path, mode='r') as sz_ref:
-                    sz_ref.extractall(temp_dir)
-            else:
-                return False  # Unsupported archive type
-            
-            # Check all files in the extracted directory
-            has_audio = False
-            for root, dirs, files in os.walk(temp_dir):
-                for file in files:
-                    file_lower = file.lower()
-                    # Check if it's an audio file
-                    if file_lower.endswith(audio_extensions):
-                        has_audio = True
-                    # If it's not an allowed extension (audio or .txt), fail
-                    elif not any(file_lower.endswith(ext) for ext in allowed_extensions):
-                        print(f"Found non-audio/non-txt file: {file}")
-                        return False
-            
-            # Return True only if at least one audio file was found
-            if has_audio:
-                print(f"Archive contains only audio files (and possibly .txt): {archive_path}")
-                return True
-            else:
-                print(f"No audio files found in archive: {archive_path}")
-                return False
-            
-    except Exception as e:
-        print(f"Error checking archive {archive_path}: {e}")
-        return False
+    has_audio = False
+    for file_name in file_list:
+        # Check if it's an audio file
+        if file_name.endswith(AUDIO_EXTENSIONS):
+            has_audio = True
+        # If it's not an allowed extension (audio or .txt), fail
+        elif not file_name.endswith(allowed_extensions):
+            log.debug("Found non-audio/non-txt file: %s", file_name)
+            return False
     
+    # Return True only if at least one audio file was found
+    return has_audio
+
+
+def has_davinci_project(names):
+    """Check if an archive listing holds a DaVinci Resolve 'project.drp' file or '.dra' project archive."""
+    for file_name in names:
+        # Zip directory entries end with '/', and a '.dra' folder may only show up
+        # as a parent component of its files, so every path component is checked
+        parts = file_name.lower().rstrip('/').split('/')
+        if parts[-1] == "project.drp" or any(part.endswith('.dra') for part in parts):
+            log.debug("Found 'project.drp' or '.dra' in archive: %s", file_name)
+            return True
+    return False
+
+
+def is_blend_extension(extension):
+    """Check if a lowercase extension belongs to a blend file or one of its numbered backups."""
+    return BLEND_EXTENSION_PATTERN.fullmatch(extension) is not None
 
-def check_davinci_archive(archive_path, archive_extensions):
+
+def has_any_extension(found_extensions, extensions):
+    """
+    Check if a set of found extensions holds one of the given extensions; extensions
+    is a tuple of extensions or a predicate taking a single extension.
+    """
+    if callable(extensions):
+        return any(extensions(extension) for extension in found_extensions)
+    return not found_extensions.isdisjoint(extensions)
+
+
+def _contains_rule(extensions):
+    """Rule predicate matching archives with a file of the given extensions anywhere inside."""
+    return lambda names, file_list, contains: contains(extensions)
+
+
+# Archive classification rules as (category, predicate), checked in priority order;
+# the first match wins. Predicates get the archive's entry names, the lowercase base
+# names of its files and a contains(extensions) helper (see has_any_extension) that
+# also looks inside nested archives. Probes that only read the top-level listing
+# come first, since contains() may have to list nested archives when the top-level
+# files don't match.
+ARCHIVE_RULES = (
+    # Archives with only PSD and TXT files (mockups)
+    ('mockups', lambda names, file_list, contains: bool(file_list) and only_specific_files(file_list, MOCKUP_EXTENSIONS)),
+    # Archives with only audio files or audio + .txt files (these never hold nested
+    # archives or substance files, so probing them first doesn't change the outcome)
+    ('audio', lambda names, file_list, contains: only_audio_files(file_list)),
+    ('substance', _contains_rule(SUBSTANCE_EXTENSIONS)),
+    # Archives with a 'project.drp' file. The '.setting' probe further down is a
+    # separate signal with a lower priority; both read the same listing.
+    ('davinci_project', lambda names, file_list, contains: has_davinci_project(names)),
+    ('font', _contains_rule(FONT_EXTENSIONS)),
+    ('zbrush', _contains_rule(ZBRUSH_EXTENSIONS)),
+    ('unity', _contains_rule(UNITY_EXTENSIONS)),
+    ('aep', _contains_rule(AEP_EXTENSIONS)),
+    ('davinci_settings', _contains_rule(DAVINCI_EXTENSIONS)),
+    ('brush', _contains_rule(BRUSH_EXTENSIONS)),
+    ('ue', _contains_rule(UE_EXTENSIONS)),
+    ('exe', _contains_rule(EXE_EXTENSIONS)),
+    ('threed', _contains_rule(THREED_EXTENSIONS)),
+    ('ebook', _contains_rule(EBOOK_EXTENSIONS)),
+    ('blender', lambda names, file_list, contains: contains(BLENDER_EXTENSIONS) or contains(is_blend_extension)),
+)
+
+# Archive names that give the category away, as (pattern, category) checked in
+# order; such archives are classified without being opened. Only unambiguous
+# markers belong here, since the name overrides whatever the archive contains.
+ARCHIVE_NAME_HINTS = (
+    (re.compile(r"unitypackage", re.IGNORECASE), 'unity'),
+    (re.compile(r"(?<![a-z0-9])ue[45](?![a-z0-9])", re.IGNORECASE), 'ue'),
+)
+
+
+def quick_hint(file_name):
+    """Return the category an archive's name points to, or None if its contents must be inspected."""
+    for pattern, category in ARCHIVE_NAME_HINTS:
+        if pattern.search(file_name):
+            log.debug("Archive classified by name as %s: %s", category, file_name)
+            return category
+    return None
+
+
+# Archive size bounds (min, max) in bytes outside of which a rule is not even
+# probed; a max of None means no upper bound. PSD-only mockup packs are small, and
+# Unreal assets never fit in an archive under 1 KiB.
+ARCHIVE_RULE_SIZE_BOUNDS = {
+    'mockups': (0, 200 * 1024 * 1024),
+    'ue': (1024, None),
+}
+
+# Number of archives matched by each rule in this run, logged at debug level by main()
+archive_rule_hits = Counter()
+
+
+# Archive listing records by path, loaded from and saved to LISTING_CACHE_PATH by main()
+archive_listing_cache = {}
+
+
+def load_listing_cache():
+    """
+    Load the archive listings saved by an earlier run. An unreadable or malformed
+    file, or one written by another cache version or with other archive extensions
+    (e.g. before py7zr was installed), gives an empty cache.
+    """
     try:
-        print(f"Checking archive for DaVinci Resolve project file: {archive_path}")
-        
-        if archive_path.lower().endswith('.zip'):
-            with zipfile.ZipFile(archive_path, 'r') as archive_file:
-                file_list = archive_file.namelist()
-                for file_name in file_list:
-                    base_name = os.path.basename(file_name).lower()
-                    if base_name == "project.drp" or file_name.lower().endswith('.dra'):
-                        print(f"Found 'project.drp' or '.dra' in zip archive: {file_name}")
-                        return True
-        
-        elif archive_path.lower().endswith('.rar'):
-            with rarfile.RarFile(archive_path, 'r') as archive_file:
-                file_list = archive_file.namelist()
-                for file_name in file_list:
-                    base_name = os.path.basename(file_name).lower()
-                    if base_name == "project.drp" or file_name.lower().endswith('.dra'):
-                        print(f"Found 'project.drp' or '.dra' in rar archive: {file_name}")
-                        return True
-        
-        elif archive_path.lower().endswith('.7z') and SUPPORT_7Z:
-            with py7zr.SevenZipFile(archive_path, mode='r') as archive_file:
-                file_list = archive_file.getnames()
-                for file_name in file_list:
-                    base_name = os.path.basename(file_name).lower()
-                    if base_name == "project.drp" or file_name.lower().endswith('.dra'):
-                        print(f"Found 'project.drp' or '.dra' in 7z archive: {file_name}")
-                        return True
-        
-        print(f"No 'project.drp' found in archive: {archive_path}")
-        return False
+        with open(LISTING_CACHE_PATH, 'r', encoding='utf-8') as cache_file:
+            data = json.load(cache_file)
+    except (OSError, ValueError):
+        return {}
+    
+    if (not isinstance(data, dict)
+            or data.get('version') != LISTING_CACHE_VERSION
+            or data.get('archive_extensions') != list(ARCHIVE_EXTENSIONS)
+            or not isinstance(data.get('records'), dict)):
+        return {}
+    return data['records']
+
+
+def save_listing_cache(cache):
+    """Save the archive listings for archives that still exist."""
+    records = {path: record for path, record in cache.items() if os.path.exists(path)}
+    data = {
+        'version': LISTING_CACHE_VERSION,
+        'archive_extensions': list(ARCHIVE_EXTENSIONS),
+        'records': records,
+    }
+    try:
+        with open(LISTING_CACHE_PATH, 'w', encoding='utf-8') as cache_file:
+            json.dump(data, cache_file)
+    except OSError as e:
+        log.error("Error saving archive listing cache %s: %s", LISTING_CACHE_PATH, e)
+
+
+def get_listing_record(archive_path, stat_result):
+    """
+    Get the cached listing record for an archive. A record is only reused while the
+    archive's size and modification time match; otherwise (or if the record is
+    malformed) a fresh one replaces it.
+    """
+    key = [stat_result.st_size, stat_result.st_mtime_ns]
+    record = archive_listing_cache.get(archive_path)
+    if not isinstance(record, dict) or record.get('key') != key:
+        record = {'key': key}
+        archive_listing_cache[archive_path] = record
+    return record
+
+
+def classify_archive(archive_path):
+    """
+    Inspect an archive's contents and return the category it belongs to, or None.
+    The archive listing is read once and every category is decided from it (nested
+    archives are listed once more, if needed); the rules in ARCHIVE_RULES are
+    checked in order and the first match wins. Archives whose names match
+    ARCHIVE_NAME_HINTS are not opened at all.
+    """
+    category = quick_hint(os.path.basename(archive_path))
+    if category is not None:
+        return category
     
+    try:
+        stat_result = os.stat(archive_path)
+        size = stat_result.st_size
+        if is_archive_too_large(archive_path, size, MAX_LIST_BYTES):
+            return None
+        
+        record = get_listing_record(archive_path, stat_result)
+        if 'entries' not in record:
+            record['entries'] = list_archive_entries(archive_path)
+        entries = record['entries']
     except Exception as e:
-        print(f"Error checking archive {archive_path}: {e}")
-        return False
+        log.error("Error reading archive %s: %s", archive_path, e)
+        return None
+    if entries is None:
+        return None  # Unsupported archive type
+    
+    names = [name for name, _ in entries]
+    # Lowercase base names of the files; directories don't count towards any category
+    file_list = [name.rsplit('/', 1)[-1].lower() for name, is_dir in entries if not is_dir]
+    # All extensions are single suffixes, so a file can only match on its last one;
+    # collecting those once turns every category probe into a set lookup instead of
+    # an endswith scan over all names
+    file_extensions = {os.path.splitext(file_name)[1] for file_name in file_list}
+    has_nested = not file_extensions.isdisjoint(ARCHIVE_EXTENSIONS)
+    
+    nested_extensions = None
+    
+    def contains(extensions):
+        nonlocal nested_extensions
+        if has_any_extension(file_extensions, extensions):
+            return True
+        if not has_nested:
+            return False
         
-def main():
+        # Extensions of the files in nested archives, collected once and only when
+        # a category needs them. Only a complete listing goes into the cache (as a
+        # sorted list); a skipped or failed one is kept for this run only, so the
+        # archive is read again next time.
+        if nested_extensions is None:
+            if 'member_extensions' in record:
+                nested_extensions = set(record['member_extensions'])
+            else:
+                nested_extensions = set()
+                try:
+                    if not is_archive_too_large(archive_path, size, MAX_SCAN_BYTES):
+                        errors = []
+                        members = list_archive_members(archive_path, errors)
+                        nested_extensions = {os.path.splitext(member)[1] for member in members}
+                        if not errors:
+                            record['member_extensions'] = sorted(nested_extensions)
+                except Exception as e:
+                    log.error("Error reading nested archives in %s: %s", archive_path, e)
+        return has_any_extension(nested_extensions, extensions)
+    
+    for category, matches in ARCHIVE_RULES:
+        min_size, max_size = ARCHIVE_RULE_SIZE_BOUNDS.get(category, (0, None))
+        if size < min_size or (max_size is not None and size > max_size):
+            continue
+        if matches(names, file_list, contains):
+            return category
+    
+    return None
+
+
+def main(argv=None):
+    global scratch_directory, archive_listing_cache
+    
+    parser = argparse.ArgumentParser(description="Categorize the files next to this script and move them to relevant directories.")
+    parser.add_argument("--debug-archive", metavar="NAME", action="append", default=[],
+                        help="print the full listing of the named archive before classifying it (can be repeated)")
+    args = parser.parse_args(argv)
+    
     # Use script directory (instead of os.getcwd())
     current_directory = script_directory
     
@@ -510,324 +683,135 @@ def main():
     unity_directory = os.path.join(current_directory, "__unitypackage__")
     zbrush_directory = os.path.join(current_directory, "__zbrush__")
     
-    # Check for send2trash library
+    # Map each extension to its target directory (earlier categories take precedence).
+    # Files are classified with a single lookup of their extension here, which stays
+    # constant-time however many extensions are added, unlike a chain of suffix tests.
+    extension_directories = {}
+    for extensions, directory in (
+        (AUDIO_EXTENSIONS, sfx_directory),
+        (FONT_EXTENSIONS, font_directory),
+        (ZBRUSH_EXTENSIONS, zbrush_directory),
+        (UNITY_EXTENSIONS, unity_directory),
+        (IMAGE_EXTENSIONS, img_directory),
+        (DOC_EXTENSIONS, docs_directory),
+        (EBOOK_EXTENSIONS, ebook_directory),
+        (SUBSTANCE_EXTENSIONS, sbsar_directory),
+        (BRUSH_EXTENSIONS, brushset_directory),
+        (THREED_EXTENSIONS, threed_directory),
+        (EXE_EXTENSIONS, exe_directory),
+        (DAVINCI_EXTENSIONS, davinci_directory),
+        (AEP_EXTENSIONS, aep_directory),
+        (UE_EXTENSIONS, ue_directory),
+    ):
+        for ext in extensions:
+            extension_directories.setdefault(ext, directory)
+    
+    # Target directory and log message for each archive category
+    archive_targets = {
+        'mockups': (mockups_directory, "Archive containing only PSD and TXT files moved to mockups directory"),
+        'substance': (sbsar_directory, "Archive containing Substance files moved to sbsar directory"),
+        'audio': (sfx_directory, "Archive containing only audio files (and possibly .txt) moved to sfx directory"),
+        'davinci_project': (davinci_directory, "Archive containing 'project.drp' moved to davinci directory"),
+        'font': (font_directory, "Archive containing font files moved to font directory"),
+        'zbrush': (zbrush_directory, "Archive containing ZBrush files moved to ZBrush directory"),
+        'unity': (unity_directory, "Archive containing Unity packages moved to Unity directory"),
+        'aep': (aep_directory, "Archive containing After Effects files moved to AEP directory"),
+        'davinci_settings': (davinci_directory, "Archive containing Davinci Resolve settings moved to davinci directory"),
+        'brush': (brushset_directory, "Archive containing brush files moved to brushset directory"),
+        'ue': (ue_directory, "Archive containing Unreal Engine assets moved to UE directory"),
+        'exe': (exe_directory, "Archive containing executables moved to exe directory"),
+        'threed': (threed_directory, "Archive containing 3D files moved to 3D files directory"),
+        'ebook': (ebook_directory, "Archive containing ebooks moved to ebook directory"),
+        'blender': (target_directory, "Archive containing Blender files moved to Blender add-ons directory"),
+    }
+    
+    # Inspecting archives is dominated by I/O and decompression in C code that
+    # releases the GIL, so archives are handed to a thread pool as soon as they
+    # are found and the moves are done here once their categories are known.
+    # Nested archives are extracted under one scratch directory for the whole run.
+    scratch_directory = tempfile.mkdtemp(prefix="dl_org_")
+    archive_listing_cache = load_listing_cache()
+    executor = ThreadPoolExecutor(max_workers=ARCHIVE_WORKERS)
+    archive_futures = []
     try:
-        import send2trash
-        print("send2trash library found. Empty folders will be moved to recycle bin.")
-        send2trash_available = True
-    except ImportError:
-        print("Note: Install 'send2trash' library to move empty folders to recycle bin.")
-        print("To install: pip install send2trash")
-        print("Without this library, empty folders will be directly deleted.\n")
-        send2trash_available = False
-    
-    # Define file extensions
-    # Image file extensions
-    image_extensions = ('.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.webp', '.svg', '.psd', 
-                        '.ico', '.raw', '.cr2', '.nef', '.heic', '.heif', '.ai', '.eps', '.dds', '.tga','.exr')
-    
-    # Document file extensions
-    doc_extensions = ('.doc', '.docx', '.pdf', '.xls', '.xlsx', '.ppt', '.pptx', '.txt', '.rtf')
-    
-    # Ebook file extensions
-    ebook_extensions = ('.epub', '.mobi', '.azw', '.azw3', '.fb2', '.lrf', '.tcr', '.lit')
-    
-    # Substance file extensions
-    substance_extensions = ('.sbsar', '.sbs', '.sbsprs', '.sbsasm', '.sbsm', '.spsm')
-    
-    # Brush file extensions
-    brush_extensions = ('.abr', '.tpl', '.brushset', '.brush','atn')
-    
-    # Font file extensions
-    font_extensions = ('.ttf', '.otf', '.woff', '.woff2', '.eot')
-    
-    # 3D model file extensions
-    threed_extensions = ('.fbx', '.obj', '.3ds', '.dae', '.stl', '.ply', '.glb', '.gltf', '.abc', '.usd', '.usda', '.usdc', '.x3d')
-    
-    # Executable file extensions
-    exe_extensions = ('.exe', '.msi', '.app', '.bat', '.cmd')
-    
-    # Davinci Resolve file extensions
-    davinci_extensions = ('.setting',)
-    
-    # After Effects file extensions
-    aep_extensions = ('.aep', '.aepx', '.aet', '.ffx', '.jsx', '.jsxbin')
-    
-    # Unity package extensions
-    unity_extensions = ('.unitypackage',)
-    
-    # ZBrush file extensions (including ZMT files)
-    zbrush_extensions = ('.zmt', '.zsc', '.zpr', '.zbr', '.ztl', '.zb', '.zpz', '.zpk', '.zprj', '.zdl')
-    
-    # Unreal Engine asset extensions
-    ue_extensions = ('.uasset', '.uplugin', '.umap', '.uproject')
-    
-    # Mockup file extensions (PSD and TXT only)
-    mockup_extensions = ('.psd', '.txt')
-    
-    # Archive extensions
-    archive_extensions = ('.zip', '.rar')
-    if SUPPORT_7Z:
-        archive_extensions = ('.zip', '.rar', '.7z')
-    
-    # Track directories that have files moved to them in this run
-    directories_used = set()
-    
-    # Process all files in the root directory
-    for file_name in os.listdir(current_directory):
-        file_path = os.path.join(current_directory, file_name)
-        
-        # Skip directories
-        if os.path.isdir(file_path):
-            continue
-        
-        try:
-
-            # Check for "mockup" in file name first
-            if handle_mockup_files(file_name, file_path, mockups_directory, directories_used):
-                continue  # Skip to next file if handled
-
-            # Check for audio files
-            if handle_audio_files(file_name, file_path, sfx_directory, directories_used):
-                continue  # Skip to next file if handled
-
-            # Process Font files
-            if file_name.lower().endswith(font_extensions):
-                create_target_directory(font_directory)
-                if move_file(file_path, font_directory):
-                    directories_used.add(font_directory)
-            
-            # Process ZBrush files (including ZMT)
-            elif file_name.lower().endswith(zbrush_extensions):
-                create_target_directory(zbrush_directory)
-                if move_file(file_path, zbrush_directory):
-                    directories_used.add(zbrush_directory)
-            
-            # Process Unity package files
-            elif file_name.lower().endswith(unity_extensions):
-                create_target_directory(unity_directory)
-                if move_file(file_path, unity_directory):
-                    directories_used.add(unity_directory)
-            
-            # Process Blend files and their backups (.blend, .blend1, .blend2, etc.)
-            elif '.blend' in file_name.lower():
-                create_target_directory(blendfiles_directory)
-                if move_file(file_path, blendfiles_directory):
-                    directories_used.add(blendfiles_directory)
-            
-            # Process Python files
-            elif file_name.lower().endswith('.py'):
-                # Don't move the currently running script
-                if file_path != os.path.abspath(__file__):
-                    create_target_directory(py_directory)
-                    if move_file(file_path, py_directory):
-                        directories_used.add(py_directory)
-                else:
-                    print(f"This script file was not moved (currently running): {file_path}")
+        # Snapshot the root directory once; DirEntry caches the file type from
+        # the directory listing, so skipping directories needs no extra stat call.
+        # Names are lowercased here, once per file, for the extension checks below.
+        with os.scandir(current_directory) as scan:
+            files = [(entry.name, entry.name.lower(), entry.path) for entry in scan if not entry.is_dir()]
+    
+        # Process all files in the root directory
+        for file_name, file_name_lower, file_path in files:
+            try:
+
+                # Check for "mockup" in file name first
+                if handle_mockup_files(file_name, file_path, mockups_directory):
+                    continue  # Skip to next file if handled
+
+                # Look up the target directory by extension
+                extension = file_extension(file_name_lower)
+                extension_directory = extension_directories.get(extension)
             
-            # Process image files
-            elif file_name.lower().endswith(image_extensions):
-                create_target_directory(img_directory)
-                if move_file(file_path, img_directory):
-                    directories_used.add(img_directory)
+                # Process Blend files and their backups (.blend, .blend1, .blend2, etc.)
+                if is_blend_extension(extension):
+                    move_file(file_path, blendfiles_directory)
             
-            # Process document files
-            elif file_name.lower().endswith(doc_extensions):
-                create_target_directory(docs_directory)
-                if move_file(file_path, docs_directory):
-                    directories_used.add(docs_directory)
+                # Process Python files
+                elif extension == '.py':
+                    # Don't move the currently running script
+                    if file_path != script_path:
+                        move_file(file_path, py_directory)
+                    else:
+                        log.info("This script file was not moved (currently running): %s", file_path)
             
-            # Process ebook files
-            elif file_name.lower().endswith(ebook_extensions):
-                create_target_directory(ebook_directory)
-                if move_file(file_path, ebook_directory):
-                    directories_used.add(ebook_directory)
+                # Process files with a known extension (audio, fonts, images, documents, etc.)
+                elif extension_directory is not None:
+                    move_file(file_path, extension_directory)
             
-            # Process Substance files
-            elif file_name.lower().endswith(substance_extensions):
-                create_target_directory(sbsar_directory)
-                if move_file(file_path, sbsar_directory):
-                    directories_used.add(sbsar_directory)
-            
-            # Process brush files
-            elif file_name.lower().endswith(brush_extensions):
-                create_target_directory(brushset_directory)
-                if move_file(file_path, brushset_directory):
-                    directories_used.add(brushset_directory)
-            
-            # Process 3D model files
-            elif file_name.lower().endswith(threed_extensions):
-                create_target_directory(threed_directory)
-                if move_file(file_path, threed_directory):
-                    directories_used.add(threed_directory)
-            
-            # Process executable files
-            elif file_name.lower().endswith(exe_extensions):
-                create_target_directory(exe_directory)
-                if move_file(file_path, exe_directory):
-                    directories_used.add(exe_directory)
-                    
-            # Process Davinci Resolve setting files
-            elif file_name.lower().endswith(davinci_extensions):
-                create_target_directory(davinci_directory)
-                if move_file(file_path, davinci_directory):
-                    directories_used.add(davinci_directory)
-                    
-            # Process After Effects files
-            elif file_name.lower().endswith(aep_extensions):
-                create_target_directory(aep_directory)
-                if move_file(file_path, aep_directory):
-                    directories_used.add(aep_directory)
-                    
-            # Process Unreal Engine asset files
-            elif file_name.lower().endswith(ue_extensions):
-                create_target_directory(ue_directory)
-                if move_file(file_path, ue_directory):
-                    directories_used.add(ue_directory)
-            
-            # Classify archives based on their contents
-            elif file_name.lower().endswith(archive_extensions):
-                # Special test for chrisRoseman_stylizedGrass.zip
-                if file_name == "chrisRoseman_stylizedGrass.zip":
-                    debug_archive(file_path)
-                
-                # Special test for 7z archives containing UE assets
-                if file_name.lower().endswith('.7z') and SUPPORT_7Z:
-                    print(f"Testing 7z archive for special content: {file_name}")
+                # Classify archives based on their contents
+                elif extension in ARCHIVE_EXTENSIONS:
+                    # Archives named with --debug-archive get a full listing first
+                    if file_name in args.debug_archive:
+                        debug_archive(file_path)
                 
-                # Check for archives with only PSD and TXT files (mockups)
-                if contains_file_in_archive(file_path, mockup_extensions, archive_extensions):
-                    # Additional check to ensure it ONLY contains PSD and TXT files
-                    if contains_only_specific_files_in_archive(file_path, mockup_extensions):
-                        create_target_directory(mockups_directory)
-                        if move_file(file_path, mockups_directory):
-                            directories_used.add(mockups_directory)
-                            print(f"Archive containing only PSD and TXT files moved to mockups directory: {file_path}")
-                            # Continue to next file since we've already moved this archive
-                            continue
+                    # 7z archives often hold UE assets
+                    if extension == '.7z':
+                        log.debug("Testing 7z archive for special content: %s", file_name)
                 
-                # Check for Substance files in archives
-                if contains_file_in_archive(file_path, substance_extensions, archive_extensions):
-                    create_target_directory(sbsar_directory)
-                    if move_file(file_path, sbsar_directory):
-                        directories_used.add(sbsar_directory)
-                        print(f"Archive containing Substance files moved to sbsar directory: {file_path}")
-                        # Continue to next file since we've already moved this archive
-                        continue
-                
-                # Check for archives with only audio files or audio + .txt files
-                if check_audio_archive(file_path, archive_extensions):
-                    create_target_directory(sfx_directory)
-                    if move_file(file_path, sfx_directory):
-                        directories_used.add(sfx_directory)
-                        print(f"Archive containing only audio files (and possibly .txt) moved to sfx directory: {file_path}")
-                        continue
-
-                # Check for archives with 'project.drp' file
-                if check_davinci_archive(file_path, archive_extensions):
-                    create_target_directory(davinci_directory)
-                    if move_file(file_path, davinci_directory):
-                        directories_used.add(davinci_directory)
-                        print(f"Archive containing 'project.drp' moved to davinci directory: {file_path}")
-                        continue
-
-                # Check for Font files in archives
-                if contains_file_in_archive(file_path, font_extensions, archive_extensions):
-                    create_target_directory(font_directory)
-                    if move_file(file_path, font_directory):
-                        directories_used.add(font_directory)
-                        print(f"Archive containing font files moved to font directory: {file_path}")
-                        # Continue to next file since we've already moved this archive
-                        continue
-                
-                # Check for ZBrush files in archives (including ZMT)
-                if contains_file_in_archive(file_path, zbrush_extensions, archive_extensions):
-                    create_target_directory(zbrush_directory)
-                    if move_file(file_path, zbrush_directory):
-                        directories_used.add(zbrush_directory)
-                        print(f"Archive containing ZBrush files moved to ZBrush directory: {file_path}")
-                        # Continue to next file since we've already moved this archive
-                        continue
-                
-                # Check for Unity package files in archives
-                if contains_file_in_archive(file_path, unity_extensions, archive_extensions):
-                    create_target_directory(unity_directory)
-                    if move_file(file_path, unity_directory):
-                        directories_used.add(unity_directory)
-                        print(f"Archive containing Unity packages moved to Unity directory: {file_path}")
-                        # Continue to next file since we've already moved this archive
-                        continue
-                
-                # Check for After Effects files in archives
-                if contains_file_in_archive(file_path, aep_extensions, archive_extensions):
-                    create_target_directory(aep_directory)
-                    if move_file(file_path, aep_directory):
-                        directories_used.add(aep_directory)
-                        print(f"Archive containing After Effects files moved to AEP directory: {file_path}")
-                        # Continue to next file since we've already moved this archive
-                        continue
-                
-                # Check for Davinci Resolve setting files in archives
-                if contains_file_in_archive(file_path, davinci_extensions, archive_extensions):
-                    create_target_directory(davinci_directory)
-                    if move_file(file_path, davinci_directory):
-                        directories_used.add(davinci_directory)
-                        print(f"Archive containing Davinci Resolve settings moved to davinci directory: {file_path}")
-                        # Continue to next file since we've already moved this archive
-                        continue
-
-                # Check for brush files in archives
-                if contains_file_in_archive(file_path, brush_extensions, archive_extensions):
-                    create_target_directory(brushset_directory)
-                    if move_file(file_path, brushset_directory):
-                        directories_used.add(brushset_directory)
-                        print(f"Archive containing brush files moved to brushset directory: {file_path}")
-                        # Continue to next file since we've already moved this archive
-                        continue
-
-                # Check for Unreal Engine assets in archives
-                if contains_file_in_archive(file_path, ue_extensions, archive_extensions):
-                    create_target_directory(ue_directory)
-                    if move_file(file_path, ue_directory):
-                        directories_used.add(ue_directory)
-                        print(f"Archive containing Unreal Engine assets moved to UE directory: {file_path}")
-                        # Continue to next file since we've already moved this archive
-                        continue
-                
-                # Check for executables in archives (including subdirectories)
-                if contains_file_in_archive(file_path, exe_extensions, archive_extensions):
-                    create_target_directory(exe_directory)
-                    if move_file(file_path, exe_directory):
-                        directories_used.add(exe_directory)
-                        print(f"Archive containing executables moved to exe directory: {file_path}")
-                        # Continue to next file since we've already moved this archive
-                        continue
-                
-                # Check for 3D files in archives
-                if contains_file_in_archive(file_path, threed_extensions, archive_extensions):
-                    create_target_directory(threed_directory)
-                    if move_file(file_path, threed_directory):
-                        directories_used.add(threed_directory)
-                        print(f"Archive containing 3D files moved to 3D files directory: {file_path}")
-                        # Continue to next file since we've already moved this archive
-                        continue
-                
-                # Check for ebooks in archives
-                if contains_file_in_archive(file_path, ebook_extensions, archive_extensions):
-                    create_target_directory(ebook_directory)
-                    if move_file(file_path, ebook_directory):
-                        directories_used.add(ebook_directory)
-                        print(f"Archive containing ebooks moved to ebook directory: {file_path}")
-                        # Continue to next file since we've already moved this archive
-                        continue
+                    # Start inspecting the archive while the remaining files are sorted
+                    archive_futures.append((file_path, executor.submit(classify_archive, file_path)))
+            except Exception as e:
+                log.error("Error processing file %s: %s", file_path, e)
+        
+        for file_path, future in archive_futures:
+            try:
+                category = future.result()
+                if category is None:
+                    continue
                 
-                # Archives containing Blender Python code or blend files
-                if contains_file_in_archive(file_path, ('.py', '.blend'), archive_extensions):
-                    create_target_directory(target_directory)
-                    if move_file(file_path, target_directory):
-                        directories_used.add(target_directory)
-        except Exception as e:
-            print(f"Error processing file {file_path}: {e}")
+                archive_rule_hits[category] += 1
+                archive_directory, message = archive_targets[category]
+                if move_file(file_path, archive_directory):
+                    log.info("%s: %s", message, file_path)
+            except Exception as e:
+                log.error("Error processing file %s: %s", file_path, e)
+    finally:
+        executor.shutdown(cancel_futures=True)
+        shutil.rmtree(scratch_directory, ignore_errors=True)
+        scratch_directory = None
+        save_listing_cache(archive_listing_cache)
+    
+    # Directories holding organized files, found with one listing per target
+    # directory instead of being tracked for every file moved
+    target_directories = {mockups_directory, blendfiles_directory, py_directory}
+    target_directories.update(extension_directories.values())
+    target_directories.update(directory for directory, _ in archive_targets.values())
+    directories_used = sorted(directory for directory in target_directories if has_entries(directory))
+    if directories_used:
+        log.info("Organized directories: %s", ", ".join(os.path.basename(directory) for directory in directories_used))
+    
+    if archive_rule_hits:
+        log.debug("Archive rule hits: %s", dict(archive_rule_hits.most_common()))
 
 
 if __name__ == "__main__":